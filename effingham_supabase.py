@@ -1,137 +1,475 @@
-import json
+import asyncio
+import logging
+import logging.handlers
+import math
 import os
+import queue
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+import asyncpg
+import httpx
+import orjson
 import paho.mqtt.client as mqtt
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
+from postgrest.exceptions import APIError
 from dotenv import load_dotenv
-from datetime import datetime
-from zoneinfo import ZoneInfo
-import re
+from datetime import datetime, timezone
 
 load_dotenv()
+log = logging.getLogger(__name__)
+
 # --- Supabase Setup ---
 url: str = os.getenv("SUPABASE_URL")
 key: str = os.getenv("SUPABASE_KEY")
-supabase: Client = create_client(url, key)
+# One keep-alive HTTP/2 session shared by every request, so TCP/TLS setup is paid once.
+# postgrest uses a custom client as-is, so its 120s timeout and redirect handling are restated here.
+http_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    timeout=httpx.Timeout(120),
+    follow_redirects=True,
+)
+supabase: Client = create_client(url, key, options=ClientOptions(httpx_client=http_client))
+
+# --- Postgres Setup ---
+# When SUPABASE_DB_URL is set, writes go straight to Postgres through an asyncpg
+# pool instead of the REST API. The pool lives on its own event loop thread.
+db_url: str | None = os.getenv("SUPABASE_DB_URL")
+pool: asyncpg.Pool | None = None
+_db_loop = asyncio.new_event_loop()
+
+# --- Batching Setup ---
+FLUSH_INTERVAL = 1.0   # seconds between flushes
+BATCH_SIZE = 50        # flush early once a buffer reaches this many rows
+MAX_BUFFER = 10_000    # readings beyond this are dropped until the next flush
+MAX_BACKOFF = 60.0     # cap, in seconds, on the retry delay after failed flushes
+
+# One buffer and flush signal per readings table; each table is flushed by its own thread.
+_buffers: dict[str, deque] = {"soil_sensor_readings": deque(), "climate_readings": deque()}
+_flush_now: dict[str, threading.Event] = {table: threading.Event() for table in _buffers}
+_buf_lock = threading.Lock()
+_flush_executor = ThreadPoolExecutor(max_workers=4)  # runs the final per-table flushes concurrently
+
+# Dropped messages/readings are counted and reported as one summary at most
+# every DROP_LOG_INTERVAL seconds, so overload cannot flood the log queue.
+DROP_LOG_INTERVAL = 10.0
+_drops: dict[str, int] = {}
+_drops_lock = threading.Lock()
+_drops_reported_at = 0.0
+
+# --- Payload Routing ---
+# (column, decoded_payload key) pairs projected into each readings table.
+_TEKTELIC_FIELDS = (
+    ("ambient_temperature", "ambient_temperature"),
+    ("light_intensity", "light_intensity"),
+    ("relative_humidity", "relative_humidity"),
+    ("soil_temperature", "Input3_voltage_to_temp"),
+    ("soil_moisture", "watermark1_tension"),
+)
+_ELSYS_FIELDS = (
+    ("temperature", "temperature"),
+    ("humidity", "humidity"),
+    ("pressure", "pressure"),
+    ("co2", "co2"),
+)
+
+def _as_float(value) -> float | None:
+    """Coerce a decoded sensor value to float, or None if it is missing, not numeric or not finite."""
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return result if math.isfinite(result) else None
+
+def _handle_tektelic(dp: dict, name: str, ts: datetime) -> dict:
+    return {"sensor_name": name, **{col: _as_float(dp.get(src)) for col, src in _TEKTELIC_FIELDS}, "received_at": ts}
+
+def _handle_elsys(dp: dict, name: str, ts: datetime) -> dict:
+    return {"sensor_name": name, **{col: _as_float(dp.get(src)) for col, src in _ELSYS_FIELDS}, "received_at": ts}
+
+# (brand_name, f_port) -> (handler, table). An f_port of None matches any port.
+_HANDLERS = {
+    ("tektelic", 10): (_handle_tektelic, "soil_sensor_readings"),
+    ("elsys", None): (_handle_elsys, "climate_readings"),
+}
+
+# --- MQTT Setup ---
+ttn_username: str = os.getenv("TTN_USERNAME")
+ttn_api_key: str = os.getenv("TTN_API_KEY")
+SOCKET_RCVBUF = 1 << 20  # 1 MiB kernel receive buffer for the broker connection
+UPLINK_TOPIC = "v3/+/devices/+/up"
+# Set MQTT_SHARE_GROUP to run several listeners against one MQTT v5 shared
+# subscription; the broker then splits uplinks between them.
+share_group: str | None = os.getenv("MQTT_SHARE_GROUP")
+client_id: str = os.getenv("MQTT_CLIENT_ID") or f"effingham-ingest-{socket.gethostname()}-{os.getpid()}"
+
+# --- Worker Setup ---
+NUM_WORKERS = 4
+_inbox: queue.Queue = queue.Queue(maxsize=10_000)  # raw MQTT payloads awaiting processing
+
+# --- Identity Cache ---
+DEVICE_REFRESH_INTERVAL = 600  # seconds between sensor_name refreshes
+
+_device_cache: dict[str, str | None] = {}  # device_eui -> sensor_name
+_cache_lock = threading.Lock()
+_UNSEEN = object()  # cache miss marker, since None is a valid sensor_name
+
+def run_db(coro):
+    """Run a coroutine on the database event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _db_loop).result()
 
-def to_est(ts: str) -> str | None:
+async def _init_connection(conn: asyncpg.Connection):
+    # Send jsonb as orjson bytes in binary format (version byte + JSON), skipping the str round trip.
+    await conn.set_type_codec(
+        'jsonb',
+        schema='pg_catalog',
+        format='binary',
+        encoder=lambda value: b'\x01' + orjson.dumps(value),
+        decoder=lambda data: orjson.loads(data[1:]),
+    )
+
+async def _create_pool() -> asyncpg.Pool:
+    # statement_cache_size=0 keeps asyncpg compatible with Supabase's transaction pooler.
+    return await asyncpg.create_pool(
+        dsn=db_url,
+        min_size=5,
+        max_size=20,
+        max_inactive_connection_lifetime=300,
+        statement_cache_size=0,
+        init=_init_connection,
+    )
+
+def start_db_pool():
+    """Start the database event loop and connection pool if SUPABASE_DB_URL is configured."""
+    global pool
+    if not db_url:
+        return
+    threading.Thread(target=_db_loop.run_forever, daemon=True).start()
+    pool = run_db(_create_pool())
+    log.info("Connected to Postgres via asyncpg pool.")
+
+def parse_received_at(ts: str | None) -> datetime | None:
     """
-    Convert received_at time to 'YYYY-MM-DD HH:MM:SS' in America/New_York.
+    Parse an RFC3339 received_at into an aware datetime (UTC if no offset is given).
     Returns None if ts is falsy or unparsable.
     """
     if not ts:
         return None
+    # Before Python 3.11, fromisoformat rejects a 'Z' suffix and fractions longer than 6 digits.
+    if ts.endswith('Z'):
+        ts = ts[:-1] + '+00:00'
+    base, dot, rest = ts.partition('.')
+    if dot:
+        digits = len(rest) - len(rest.lstrip('0123456789'))
+        ts = f"{base}.{rest[:digits][:6].ljust(6, '0')}{rest[digits:]}"
     try:
-        m = re.match(r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?Z$', ts)
-        if m:
-            base, frac = m.group(1), (m.group(2) or '')
-            frac6 = (frac[:6]).ljust(6, '0')  # microseconds for Python
-            dt_utc = datetime.fromisoformat(f"{base}.{frac6}+00:00")
-        else:
-            dt_utc = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-        et = dt_utc.astimezone(ZoneInfo("America/New_York"))
-        return et.strftime('%Y-%m-%d %H:%M:%S')
-    except Exception:
+        dt = datetime.fromisoformat(ts)
+    except ValueError:
         return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
 
-def on_connect(mqttc, obj, flags, rc):
-    """Callback for when the client connects to the MQTT broker."""
-    if rc == 0:
-        print("Connected to MQTT Broker!")
-        mqttc.subscribe("v3/+/devices/+/up", 0)
+async def pg_insert(table: str, rows: list[dict]):
+    """Bulk-load a batch of readings into `table` with binary COPY over a pooled connection."""
+    async with pool.acquire() as conn:
+        await conn.copy_records_to_table(table, records=[tuple(row.values()) for row in rows], columns=list(rows[0]))
+
+def note_drop(what: str, count: int = 1):
+    """Count dropped items under `what` and log a summary if DROP_LOG_INTERVAL has passed."""
+    global _drops_reported_at
+    with _drops_lock:
+        _drops[what] = _drops.get(what, 0) + count
+        now = time.monotonic()
+        if now - _drops_reported_at < DROP_LOG_INTERVAL:
+            return
+        summary = ", ".join(f"{n} {w}" for w, n in _drops.items())
+        _drops.clear()
+        _drops_reported_at = now
+    log.warning("Dropped since last report: %s", summary)
+
+def buffer_reading(table: str, row: dict) -> bool:
+    """Queue a reading for the next batched insert into `table`. Returns False if it was dropped."""
+    buf = _buffers[table]
+    with _buf_lock:
+        if len(buf) >= MAX_BUFFER:
+            return False
+        buf.append(row)
+        if len(buf) >= BATCH_SIZE:
+            _flush_now[table].set()
+    return True
+
+def insert_rows(table: str, rows: list[dict]):
+    """Insert readings into `table` with a single request."""
+    if pool is not None:
+        run_db(pg_insert(table, rows))
     else:
-        print(f"Failed to connect to MQTT, return code {rc}")
+        rows = [{**row, "received_at": row["received_at"].isoformat()} for row in rows]
+        # The inserted rows are never read back, so skip serialising them in the response.
+        supabase.table(table).insert(rows, returning="minimal").execute()
+
+def is_data_error(e: Exception) -> bool:
+    """True if an insert failed because of the rows themselves rather than the connection or server."""
+    if isinstance(e, APIError):
+        # SQLSTATE class 22 is a data exception, 23 an integrity constraint violation;
+        # PGRST1xx/PGRST2xx are PostgREST request and schema errors that a retry cannot fix.
+        return str(e.code or '').startswith(('22', '23', 'PGRST1', 'PGRST2'))
+    return isinstance(e, (asyncpg.DataError, asyncpg.IntegrityConstraintViolationError, TypeError, ValueError))
+
+def requeue(buf: deque, rows: list[dict]):
+    """Put unsent readings back at the front of a buffer, keeping it within MAX_BUFFER."""
+    with _buf_lock:
+        room = max(MAX_BUFFER - len(buf), 0)
+        buf.extendleft(reversed(rows[:room]))
+    if len(rows) > room:
+        note_drop("unrequeued readings", len(rows) - room)
+
+def insert_bisecting(table: str, rows: list[dict]) -> list[dict]:
+    """
+    Insert readings into `table`, halving the batch on data errors until the offending
+    rows are isolated and dropped, so one bad row costs O(log n) requests.
+    Returns the readings left unsent by a transient failure.
+    """
+    try:
+        insert_rows(table, rows)
+        return []
+    except Exception as e:
+        if not is_data_error(e):
+            log.warning("Failed to insert %d readings into %s: %s", len(rows), table, e)
+            return rows
+        if len(rows) == 1:
+            log.error("Dropping %s reading from %s: %s", table, rows[0].get('sensor_name'), e)
+            return []
+    mid = len(rows) // 2
+    unsent = insert_bisecting(table, rows[:mid])
+    if unsent:
+        return unsent + rows[mid:]
+    return insert_bisecting(table, rows[mid:])
+
+def flush_buffer(table: str) -> bool:
+    """
+    Drain a table's buffer and insert its readings with a single request, requeueing
+    whatever a transient failure left unsent. Returns False if anything was requeued.
+    """
+    buf = _buffers[table]
+    with _buf_lock:
+        batch = list(buf)
+        buf.clear()
+    if not batch:
+        return True
+    unsent = insert_bisecting(table, batch)
+    if unsent:
+        requeue(buf, unsent)
+        return False
+    log.debug("Flushed %d readings into %s.", len(batch), table)
+    return True
+
+def flush_all():
+    """Flush every reading buffer in parallel and wait for all of them to finish."""
+    wait([_flush_executor.submit(flush_buffer, table) for table in _buffers])
+
+def run_flusher(table: str):
+    """
+    Flush one table every FLUSH_INTERVAL seconds, or sooner when its buffer fills up.
+    After a failed flush, wait with exponential backoff before retrying.
+    """
+    backoff = 0.0
+    while True:
+        if backoff:
+            time.sleep(backoff)
+        _flush_now[table].wait(FLUSH_INTERVAL)
+        _flush_now[table].clear()
+        backoff = 0.0 if flush_buffer(table) else min(max(backoff * 2, FLUSH_INTERVAL), MAX_BACKOFF)
+
+def register_device(device_eui: str, brand_name: str, f_port: int | None, decoded_payload: dict, received_at: datetime) -> str | None:
+    """
+    Register a first-seen device with the ingest_reading SQL function (sql/ingest_reading.sql),
+    which upserts its Brand and Device rows and stores this uplink's reading in one round trip.
+    Caches and returns the device's sensor_name.
+    """
+    if pool is not None:
+        device_name = run_db(pool.fetchval(
+            'SELECT ingest_reading($1, $2, $3, $4, $5)',
+            brand_name, device_eui, f_port, decoded_payload, received_at,
+        ))
+    else:
+        device_name = supabase.rpc("ingest_reading", {
+            "brand": brand_name,
+            "eui": device_eui,
+            "port": f_port,
+            "payload": decoded_payload,
+            "ts": received_at.isoformat(),
+        }).execute().data
+
+    with _cache_lock:
+        _device_cache[device_eui] = device_name
+    return device_name
+
+def run_device_refresher():
+    """Periodically reload sensor_name for every device so external edits are picked up."""
+    while True:
+        time.sleep(DEVICE_REFRESH_INTERVAL)
+        try:
+            if pool is not None:
+                rows = run_db(pool.fetch('SELECT device_eui, sensor_name FROM devices'))
+            else:
+                rows = supabase.table("devices").select("device_eui, sensor_name").execute().data
+        except Exception as e:
+            log.warning("Failed to refresh device cache: %s", e)
+            continue
+        with _cache_lock:
+            _device_cache.update({row['device_eui']: row['sensor_name'] for row in rows})
+
+def on_connect(mqttc, obj, flags, reason_code, properties):
+    """Callback for when the client connects to the MQTT broker."""
+    if reason_code.is_failure:
+        log.error("Failed to connect to MQTT, reason code %s", reason_code)
+        return
+    log.info("Connected to MQTT Broker as %s!", client_id)
+    topic = f"$share/{share_group}/{UPLINK_TOPIC}" if share_group else UPLINK_TOPIC
+    mqttc.subscribe(topic, 0)
 
 def on_message(mqttc, obj, msg):
-    """Callback for when a message is received from the broker."""
+    """Callback for when a message is received from the broker. Hands the payload to the workers."""
     try:
-        payload = json.loads(msg.payload.decode('UTF-8'))
-        
-        device_eui = payload.get('end_device_ids', {}).get('device_id')
-        uplink_message = payload.get('uplink_message', {})
-        brand_name = uplink_message.get('version_ids', {}).get('brand_id')
-        decoded_payload = uplink_message.get('decoded_payload')
-        received_at_raw = uplink_message.get('received_at') or payload.get('received_at')
+        _inbox.put_nowait(msg.payload)
+    except queue.Full:
+        note_drop("messages (inbox full)")
+
+def run_worker():
+    """Process payloads from the inbox until the process exits."""
+    while True:
+        raw = _inbox.get()
+        try:
+            process_payload(raw)
+        finally:
+            _inbox.task_done()
 
+def process_payload(raw: bytes):
+    """Decode an uplink, resolve its device and queue the reading for insertion."""
+    try:
+        payload = orjson.loads(raw)
+
+        try:
+            device_eui = payload['end_device_ids']['device_id']
+            uplink_message = payload['uplink_message']
+            brand_name = uplink_message['version_ids']['brand_id']
+            decoded_payload = uplink_message['decoded_payload']
+        except (KeyError, TypeError):
+            return # Skip if essential info is missing
+        if not (device_eui and brand_name and decoded_payload):
+            return
 
+        received_at_raw = uplink_message.get('received_at') or payload.get('received_at')
         if not received_at_raw:
             for md in uplink_message.get('rx_metadata') or []:
                 received_at_raw = md.get('received_at') or md.get('time')
                 if received_at_raw:
                     break
-        received_at_est = to_est(received_at_raw)
-
-        if not all([device_eui, brand_name, decoded_payload]):
-            return # Skip if essential info is missing
+        # Parse once here so every write path stores the same value. Batched rows always
+        # send received_at, so the column default never applies; stamp missing or bad ones here.
+        received_at = parse_received_at(received_at_raw)
+        if received_at is None:
+            if received_at_raw:
+                log.warning("Unparsable received_at %r from %s, using the current time.", received_at_raw, device_eui)
+            received_at = datetime.now(timezone.utc)
 
-        print(f"Processing message from Device: {device_eui}, Brand: {brand_name}")
+        log.debug("Processing message from Device: %s, Brand: %s", device_eui, brand_name)
 
-        # --- Step 1: Ensure Brand and Device exist in DB ---
-        supabase.table("Brands").upsert({"brand_name": brand_name}, on_conflict="brand_name").execute().data
+        f_port = uplink_message.get('f_port')
 
-        device_data = supabase.table("Devices").upsert({"device_eui": device_eui, "brand": brand_name}, on_conflict="device_eui").execute().data
-        device_name = device_data[0]['sensor_name']
+        # --- Step 1: Look up the device, registering it on first sight ---
+        with _cache_lock:
+            device_name = _device_cache.get(device_eui, _UNSEEN)
+        if device_name is _UNSEEN:
+            # ingest_reading also stores this uplink's reading, so there is nothing left to queue.
+            device_name = register_device(device_eui, brand_name, f_port, decoded_payload, received_at)
+            log.info("Registered device %s (sensor_name: %s).", device_eui, device_name)
+            return
 
         # --- Check if sensor_name is set before inserting readings ---
         if device_name is None:
-            print(f"-> Device {device_eui} exists but sensor_name is not set. Skipping reading insertion.")
+            log.debug("Device %s exists but sensor_name is not set. Skipping reading insertion.", device_eui)
             return
 
-        # --- Step 2: Route and Insert sensor data based on brand ---
-
-        # Handle Tektelic soil sensors
-        if brand_name == "tektelic" and uplink_message.get('f_port') == 10:
-            print("-> Tektelic sensor data found. Inserting into SoilSensorReadings.")
-            data_to_insert = {
-                "sensor_name": device_name,
-                "ambient_temperature": decoded_payload.get('ambient_temperature'),
-                "light_intensity": decoded_payload.get('light_intensity'),
-                "relative_humidity": decoded_payload.get('relative_humidity'),
-                "soil_temperature": decoded_payload.get('Input3_voltage_to_temp'),
-                "soil_moisture": decoded_payload.get('watermark1_tension'),
-                "received_at": received_at_est
-            }
-            supabase.table("SoilSensorReadings").insert(data_to_insert).execute()
-            print("-> Successfully inserted soil data.")
-
-        # Handle Elsys climate sensors
-        elif brand_name == "elsys":
-            print("-> Elsys sensor data found. Inserting into ClimateReadings.")
-            data_to_insert = {
-                "sensor_name": device_name,
-                "temperature": decoded_payload.get('temperature'),
-                "humidity": decoded_payload.get('humidity'),
-                "pressure": decoded_payload.get('pressure'),
-                "co2": decoded_payload.get('co2'),
-                "received_at": received_at_est
-            }
-            supabase.table("ClimateReadings").insert(data_to_insert).execute()
-            print("-> Successfully inserted climate data.")
-        
-        else:
-            print(f"-> No specific handler for brand '{brand_name}'. Skipping data insert.")
+        # --- Step 2: Route and Insert sensor data based on brand and port ---
+        route = _HANDLERS.get((brand_name, f_port)) or _HANDLERS.get((brand_name, None))
+        if route is None:
+            log.debug("No specific handler for brand '%s'. Skipping data insert.", brand_name)
+            return
+
+        handler, table = route
+        log.debug("%s sensor data found. Queueing for %s.", brand_name, table)
+        if not buffer_reading(table, handler(decoded_payload, device_name, received_at)):
+            note_drop(f"{table} readings (buffer full)")
 
     except Exception as e:
-        print(f"An error occurred: {e}")
+        log.error("An error occurred: %s", e)
 
-def on_subscribe(mqttc, obj, mid, granted_qos):
+def on_socket_open(mqttc, obj, sock):
+    """Callback for when the broker socket is opened. Enlarges its receive buffer."""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF)
+
+def on_subscribe(mqttc, obj, mid, reason_code_list, properties):
     """Callback for when the client successfully subscribes to a topic."""
-    print(f"Subscribed: {mid} {granted_qos}")
+    log.info("Subscribed: %s %s", mid, reason_code_list)
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Route log records through a queue so stream I/O happens on a background thread.
+    The level comes from LOG_LEVEL (default WARNING) so hot-path debug calls stay cheap.
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(os.getenv("LOG_LEVEL", "WARNING").upper())
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream)
+    listener.start()
+    return listener
 
 def run_mqtt_listener():
     """Sets up and runs the MQTT client."""
-    mqttc = mqtt.Client(mqtt.CallbackAPIVersion.VERSION1)
+    if not (ttn_username and ttn_api_key):
+        raise SystemExit("TTN_USERNAME and TTN_API_KEY must be set to connect to The Things Network.")
+    log_listener = setup_logging()
+    mqttc = mqtt.Client(
+        mqtt.CallbackAPIVersion.VERSION2,
+        client_id=client_id,
+        protocol=mqtt.MQTTv5 if share_group else mqtt.MQTTv311,
+    )
     mqttc.on_message = on_message
     mqttc.on_connect = on_connect
     mqttc.on_subscribe = on_subscribe
-    mqttc.username_pw_set("gatech-effingham@ttn", "NNSXS.LGQMJICYDFLYT33BHKZSWH5NGFE4GJVNIW4GE3Y.LN45PC3GTPDMSBDBZLKHOEDSF7GLVYTJYIRBJ4JQVOXYFDVUQOUA")
+    mqttc.on_socket_open = on_socket_open
+    mqttc.max_inflight_messages_set(1000)
+    mqttc.max_queued_messages_set(100000)
+    mqttc.reconnect_delay_set(min_delay=1, max_delay=30)
+    mqttc.username_pw_set(ttn_username, ttn_api_key)
     mqttc.connect("nam1.cloud.thethings.network", 1883, 60)
 
+    start_db_pool()
+
+    for _ in range(NUM_WORKERS):
+        threading.Thread(target=run_worker, daemon=True).start()
+    for table in _buffers:
+        threading.Thread(target=run_flusher, args=(table,), daemon=True).start()
+    threading.Thread(target=run_device_refresher, daemon=True).start()
+
     try:
-        print("Starting MQTT listener to ingest all data... Press Ctrl+C to stop.")
-        mqttc.loop_forever()
+        log.info("Starting MQTT listener to ingest all data... Press Ctrl+C to stop.")
+        mqttc.loop_start()
+        while True:
+            time.sleep(1)  # short sleeps keep Ctrl+C deliverable on Windows
     except KeyboardInterrupt:
-        print("\nListener stopped by user.")
+        log.info("Listener stopped by user.")
         mqttc.disconnect()
+        mqttc.loop_stop()
+        _inbox.join()  # let the workers finish payloads that were already received
+        flush_all()
+        log_listener.stop()
 
 if __name__ == '__main__':
     run_mqtt_listener()
\ No newline at end of file
@@ -0,0 +1,86 @@
+-- ingest_reading: registers an uplink's brand and device and inserts its
+-- reading in a single server-side transaction.
+--
+-- The listener calls this the first time it sees a device, so identity
+-- resolution and the first insert cost one round trip instead of three.
+-- Returns the device's sensor_name (NULL until one is assigned, in which case
+-- no reading is stored). Routing mirrors _HANDLERS in effingham_supabase.py.
+
+-- safe_float mirrors _as_float: numbers and numeric strings become float8,
+-- anything else (including NaN and infinities) becomes NULL instead of
+-- aborting the registration.
+CREATE OR REPLACE FUNCTION safe_float(value jsonb)
+RETURNS float8
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+    result float8;
+BEGIN
+    IF jsonb_typeof(value) NOT IN ('number', 'string') THEN
+        RETURN NULL;
+    END IF;
+    result := (value #>> '{}')::float8;
+    IF result IN ('NaN'::float8, 'Infinity'::float8, '-Infinity'::float8) THEN
+        RETURN NULL;
+    END IF;
+    RETURN result;
+EXCEPTION
+    WHEN invalid_text_representation OR numeric_value_out_of_range THEN
+        RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION ingest_reading(
+    brand   text,
+    eui     text,
+    port    int,
+    payload jsonb,
+    ts      timestamptz
+)
+RETURNS text
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_sensor_name text;
+BEGIN
+    INSERT INTO brands (brand_name) VALUES (brand)
+    ON CONFLICT (brand_name) DO NOTHING;
+
+    INSERT INTO devices (device_eui, brand) VALUES (eui, brand)
+    ON CONFLICT (device_eui) DO UPDATE SET brand = EXCLUDED.brand
+    RETURNING sensor_name INTO v_sensor_name;
+
+    IF v_sensor_name IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    IF brand = 'tektelic' AND port = 10 THEN
+        INSERT INTO soil_sensor_readings
+            (sensor_name, ambient_temperature, light_intensity, relative_humidity,
+             soil_temperature, soil_moisture, received_at)
+        VALUES (
+            v_sensor_name,
+            safe_float(payload->'ambient_temperature'),
+            safe_float(payload->'light_intensity'),
+            safe_float(payload->'relative_humidity'),
+            safe_float(payload->'Input3_voltage_to_temp'),
+            safe_float(payload->'watermark1_tension'),
+            COALESCE(ts, now())
+        );
+    ELSIF brand = 'elsys' THEN
+        INSERT INTO climate_readings
+            (sensor_name, temperature, humidity, pressure, co2, received_at)
+        VALUES (
+            v_sensor_name,
+            safe_float(payload->'temperature'),
+            safe_float(payload->'humidity'),
+            safe_float(payload->'pressure'),
+            safe_float(payload->'co2'),
+            COALESCE(ts, now())
+        );
+    END IF;
+
+    RETURN v_sensor_name;
+END
+$$;
\ No newline at end of file
@@ -0,0 +1,14 @@
+-- Rename the quoted CamelCase tables to unquoted snake_case identifiers so
+-- PostgREST and asyncpg address them without case-preserving quotes.
+--
+-- Apply after received_at_timestamptz.sql. ingest_reading.sql already refers
+-- to the new names; run it again afterwards so the function is recreated.
+
+BEGIN;
+
+ALTER TABLE "Brands" RENAME TO brands;
+ALTER TABLE "Devices" RENAME TO devices;
+ALTER TABLE "SoilSensorReadings" RENAME TO soil_sensor_readings;
+ALTER TABLE "ClimateReadings" RENAME TO climate_readings;
+
+COMMIT;
\ No newline at end of file
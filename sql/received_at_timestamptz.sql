@@ -0,0 +1,24 @@
+-- Store received_at as timestamptz, filled from the raw RFC3339 uplink
+-- timestamp (or now() when absent) instead of a client-formatted Eastern time.
+--
+-- Existing rows hold naive America/New_York wall-clock times, so they are
+-- reinterpreted in that zone. Convert for display in queries, e.g.
+--   SELECT received_at AT TIME ZONE 'America/New_York' FROM soil_sensor_readings;
+--
+-- Run sql/ingest_reading.sql again afterwards to recreate the function with
+-- its timestamptz signature (after lowercase_table_names.sql, which renames
+-- the tables it writes to).
+
+BEGIN;
+
+ALTER TABLE "SoilSensorReadings"
+    ALTER COLUMN received_at TYPE timestamptz USING received_at AT TIME ZONE 'America/New_York',
+    ALTER COLUMN received_at SET DEFAULT now();
+
+ALTER TABLE "ClimateReadings"
+    ALTER COLUMN received_at TYPE timestamptz USING received_at AT TIME ZONE 'America/New_York',
+    ALTER COLUMN received_at SET DEFAULT now();
+
+DROP FUNCTION IF EXISTS ingest_reading(text, text, int, jsonb, timestamp);
+
+COMMIT;
\ No newline at end of file